@@ -10,60 +10,98 @@ Usage:
 
 import logging
 import sys
+from bisect import bisect_left
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from itertools import chain
 
-import feedparser
+import numpy as np
+import pandas as pd
 import yfinance as yf
 
+try:
+    import xxhash
+except ImportError:  # fall back to the builtin (per-process) hash
+    xxhash = None
+
 import config
+from news_collector import fetch_yahoo_feeds
 from sentiment_analyzer import analyze_sentiment
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
 logger = logging.getLogger("backtester")
 
 SENTIMENT_SCORES = {"positive": 1.0, "negative": -1.0, "neutral": 0.0}
 
 LOOKBACK_DAYS = 30
 
+# Titles with fewer words than this (after normalization) are not worth scoring
+MIN_TITLE_WORDS = 3
+
+# Byte translation table for title normalization: ASCII letters are lowercased,
+# other ASCII punctuation/whitespace becomes a space, non-ASCII bytes pass through
+_TITLE_TRANS = bytes(
+    b if b >= 0x80 or chr(b).isdigit() else ord(chr(b).lower()) if chr(b).isalpha() else 0x20
+    for b in range(256)
+)
+
+# Threshold search: a coarse grid, then a fine grid around the best coarse results
+MIN_ARTICLES_OPTIONS = [1, 2, 3, 5]
+COARSE_STEP = 0.1
+REFINE_STEP = 0.01
+REFINE_RADIUS = 5  # fine steps either side of a coarse result
+REFINE_TOP_N = 5
+
+
+def _dated_articles(ticker: str, entries: list[dict]) -> list[dict]:
+    """Build dated Yahoo RSS articles for a single ticker from its feed entries."""
+    articles = []
+    for entry in entries:
+        if entry["published"] is None:
+            continue  # skip articles without dates
+        articles.append({
+            "title": entry["title"],
+            "summary": entry["summary"],
+            "source": "Yahoo Finance",
+            "ticker": ticker,
+            "published": entry["published"],
+            "link": entry["link"],
+        })
+    return articles
+
+
+def _title_words(title: str) -> list[bytes]:
+    """Split a title into lowercased words, ignoring punctuation."""
+    return title.encode("utf-8", "ignore").translate(_TITLE_TRANS).split()
+
+
+def _title_fingerprint(words: list[bytes], ticker: str) -> int:
+    """64-bit fingerprint of a normalized (title, ticker) pair, used as the dedup key."""
+    key = ticker.encode() + b"|" + b" ".join(words)
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(key)
+    return hash(key)
 
-def collect_historical_news() -> list[dict]:
-    """Fetch news from Yahoo RSS for all tickers, preserving published dates."""
-    all_articles = []
-    for ticker in config.ALL_TICKERS:
-        url = config.YAHOO_RSS_URL.format(ticker=ticker)
-        try:
-            feed = feedparser.parse(url)
-            for entry in feed.entries:
-                published = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-                if published is None:
-                    continue  # skip articles without dates
-                all_articles.append({
-                    "title": entry.get("title", ""),
-                    "summary": entry.get("summary", ""),
-                    "source": "Yahoo Finance",
-                    "ticker": ticker,
-                    "published": published,
-                    "link": entry.get("link", ""),
-                })
-            logger.info("Yahoo RSS for %s: %d articles", ticker, len(feed.entries))
-        except Exception:
-            logger.exception("Error fetching Yahoo RSS for %s", ticker)
 
-    # Filter out empty titles
-    all_articles = [a for a in all_articles if a["title"].strip()]
+def collect_historical_news(yahoo_feeds: dict[str, list[dict]] | None = None) -> list[dict]:
+    """Fetch news from Yahoo RSS for all tickers, preserving published dates.
 
-    # Deduplicate by title
+    yahoo_feeds, as returned by fetch_yahoo_feeds(), reuses already fetched
+    feeds instead of requesting them again.
+    """
+    if yahoo_feeds is None:
+        yahoo_feeds = fetch_yahoo_feeds()
+    all_articles = list(chain.from_iterable(
+        _dated_articles(ticker, yahoo_feeds.get(ticker, [])) for ticker in config.ALL_TICKERS
+    ))
+
+    # Drop near-empty titles and deduplicate on normalized (title, ticker)
     seen = set()
     unique = []
     for art in all_articles:
-        key = art["title"].strip().lower()
+        words = _title_words(art["title"])
+        if len(words) < MIN_TITLE_WORDS:
+            continue
+        key = _title_fingerprint(words, art["ticker"])
         if key not in seen:
             seen.add(key)
             unique.append(art)
@@ -81,39 +119,51 @@ def fetch_price_data(tickers: list[str], days: int = LOOKBACK_DAYS) -> dict:
     start = end - timedelta(days=days + 10)  # extra buffer for weekends
 
     prices = {}
+    if not tickers:
+        return prices
+
+    # One batched request for all tickers instead of one request per ticker
+    try:
+        df = yf.download(tickers, start=start.strftime("%Y-%m-%d"),
+                         end=end.strftime("%Y-%m-%d"), group_by="ticker",
+                         threads=True, progress=False)
+    except Exception:
+        logger.exception("Error fetching price data for %s", ", ".join(tickers))
+        return prices
+
+    if df.empty:
+        logger.warning("No price data for %s", ", ".join(tickers))
+        return prices
+
     for ticker in tickers:
         try:
-            df = yf.download(ticker, start=start.strftime("%Y-%m-%d"),
-                             end=end.strftime("%Y-%m-%d"), progress=False)
-            if df.empty:
+            # group_by="ticker" yields (ticker, field) columns; older yfinance
+            # versions return flat columns when only one ticker is requested
+            sub = df[ticker] if hasattr(df.columns, 'levels') else df
+            closes = sub["Close"].dropna()
+            if closes.empty:
                 logger.warning("No price data for %s", ticker)
                 continue
-            # Flatten MultiIndex columns if present (yfinance returns MultiIndex for single ticker too)
-            if hasattr(df.columns, 'levels'):
-                df.columns = df.columns.get_level_values(0)
-            daily = {}
-            for idx, row in df.iterrows():
-                date_str = idx.strftime("%Y-%m-%d")
-                daily[date_str] = float(row["Close"])
+            index = closes.index
+            if not isinstance(index, pd.DatetimeIndex):
+                index = pd.to_datetime(index)
+            dates = index.strftime("%Y-%m-%d").to_numpy()
+            daily = dict(zip(dates.tolist(), closes.to_numpy(dtype=np.float64).tolist()))
             prices[ticker] = daily
             logger.info("Price data for %s: %d days", ticker, len(daily))
+        except KeyError:
+            logger.warning("No price data for %s", ticker)
         except Exception:
-            logger.exception("Error fetching price data for %s", ticker)
+            logger.exception("Error parsing price data for %s", ticker)
 
     return prices
 
 
-def compute_next_day_change(prices: dict, date_str: str) -> float | None:
-    """Given a dict of {date_str: price}, find the % change from date_str to the next trading day."""
-    sorted_dates = sorted(prices.keys())
-    if date_str not in sorted_dates:
-        # Find the nearest trading day on or after date_str
-        candidates = [d for d in sorted_dates if d >= date_str]
-        if not candidates:
-            return None
-        date_str = candidates[0]
-
-    idx = sorted_dates.index(date_str)
+def compute_next_day_change(prices: dict, sorted_dates: list[str], date_str: str) -> float | None:
+    """Given a dict of {date_str: price} and its sorted keys, find the % change
+    from date_str (or the nearest trading day after it) to the next trading day."""
+    # Nearest trading day on or after date_str
+    idx = bisect_left(sorted_dates, date_str)
     if idx + 1 >= len(sorted_dates):
         return None  # no next day available
 
@@ -124,41 +174,54 @@ def compute_next_day_change(prices: dict, date_str: str) -> float | None:
     return ((price_next - price_today) / price_today) * 100
 
 
-def compute_sentiment_score(articles: list[dict]) -> float:
-    """Compute weighted sentiment score for a group of articles (same formula as signal_generator)."""
-    weighted_sum = 0.0
-    weight_total = 0.0
-    for art in articles:
-        score = SENTIMENT_SCORES.get(art.get("sentiment", "neutral"), 0.0)
-        conf = art.get("confidence", 0.5)
-        weighted_sum += score * conf
-        weight_total += conf
-    return weighted_sum / weight_total if weight_total > 0 else 0.0
+def _article_weights(articles: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+    """Return (score * confidence, confidence) arrays for a list of articles."""
+    n = len(articles)
+    confs = np.fromiter((art.get("confidence", 0.5) for art in articles), dtype=np.float64, count=n)
+    scores = np.fromiter((SENTIMENT_SCORES.get(art.get("sentiment", "neutral"), 0.0)
+                          for art in articles), dtype=np.float64, count=n)
+    return scores * confs, confs
 
 
 def build_backtest_table(articles: list[dict], prices: dict) -> list[dict]:
     """Build a table of [ticker, date, sentiment_score, actual_change%, article_count]."""
-    # Group articles by (ticker, date)
-    groups = defaultdict(list)
-    for art in articles:
+    # Assign each article a (ticker, date) group id; per-group sums are then
+    # computed in one bincount pass instead of materializing article lists
+    group_ids = {}
+    date_strs = {}  # published datetime -> date_str, so each timestamp is formatted once
+    article_groups = np.empty(len(articles), dtype=np.int64)
+    for k, art in enumerate(articles):
         pub = art["published"]
-        date_str = pub.strftime("%Y-%m-%d")
-        groups[(art["ticker"], date_str)].append(art)
+        date_str = date_strs.get(pub)
+        if date_str is None:
+            date_str = date_strs[pub] = pub.strftime("%Y-%m-%d")
+        article_groups[k] = group_ids.setdefault((art["ticker"], date_str), len(group_ids))
+
+    weighted, confs = _article_weights(articles)
+    n_groups = len(group_ids)
+    weighted_sums = np.bincount(article_groups, weights=weighted, minlength=n_groups)
+    weight_totals = np.bincount(article_groups, weights=confs, minlength=n_groups)
+    article_counts = np.bincount(article_groups, minlength=n_groups)
+
+    # Sort each ticker's trading days once instead of once per group
+    sorted_dates = {ticker: sorted(daily) for ticker, daily in prices.items()}
 
     table = []
-    for (ticker, date_str), arts in sorted(groups.items()):
+    for (ticker, date_str), g in group_ids.items():
         if ticker not in prices:
             continue
-        change = compute_next_day_change(prices[ticker], date_str)
+        change = compute_next_day_change(prices[ticker], sorted_dates[ticker], date_str)
         if change is None:
             continue
-        score = compute_sentiment_score(arts)
+        # Confidence-weighted mean sentiment, same formula as signal_generator
+        weight_total = weight_totals[g]
+        score = float(weighted_sums[g] / weight_total) if weight_total > 0 else 0.0
         table.append({
             "ticker": ticker,
             "date": date_str,
             "sentiment_score": score,
             "actual_change_pct": change,
-            "article_count": len(arts),
+            "article_count": int(article_counts[g]),
         })
 
     return table
@@ -170,38 +233,33 @@ def evaluate_thresholds(table: list[dict], buy_thresh: float, sell_thresh: float
 
     Returns dict with accuracy metrics and confusion matrix counts.
     """
-    tp_buy = 0   # predicted BUY, price went up
-    fp_buy = 0   # predicted BUY, price went down
-    tp_sell = 0  # predicted SELL, price went down
-    fp_sell = 0  # predicted SELL, price went up
-    hold_count = 0
-    total_signals = 0
+    return _evaluate_arrays(_table_arrays(table), buy_thresh, sell_thresh, min_articles)
 
-    for row in table:
-        score = row["sentiment_score"]
-        change = row["actual_change_pct"]
-        count = row["article_count"]
 
-        if count < min_articles:
-            hold_count += 1
-            continue
+def _evaluate_arrays(arrays: tuple[np.ndarray, np.ndarray, np.ndarray], buy_thresh: float,
+                     sell_thresh: float, min_articles: int) -> dict:
+    """Evaluate thresholds against (scores, changes, counts) arrays from _table_arrays."""
+    scores, changes, counts = arrays
+    valid = counts >= min_articles
+    is_buy = valid & (scores > buy_thresh)
+    is_sell = valid & ~is_buy & (scores < sell_thresh)
+
+    tp_buy = int(np.count_nonzero(is_buy & (changes > 0)))    # predicted BUY, price went up
+    fp_buy = int(np.count_nonzero(is_buy)) - tp_buy            # predicted BUY, price went down
+    tp_sell = int(np.count_nonzero(is_sell & (changes < 0)))  # predicted SELL, price went down
+    fp_sell = int(np.count_nonzero(is_sell)) - tp_sell         # predicted SELL, price went up
+    hold_count = len(scores) - tp_buy - fp_buy - tp_sell - fp_sell
 
-        if score > buy_thresh:
-            total_signals += 1
-            if change > 0:
-                tp_buy += 1
-            else:
-                fp_buy += 1
-        elif score < sell_thresh:
-            total_signals += 1
-            if change < 0:
-                tp_sell += 1
-            else:
-                fp_sell += 1
-        else:
-            hold_count += 1
+    return _threshold_result(buy_thresh, sell_thresh, min_articles,
+                             tp_buy, fp_buy, tp_sell, fp_sell, hold_count)
 
+
+def _threshold_result(buy_thresh: float, sell_thresh: float, min_articles: int,
+                      tp_buy: int, fp_buy: int, tp_sell: int, fp_sell: int,
+                      hold_count: int) -> dict:
+    """Assemble the accuracy metrics dict from confusion matrix counts."""
     correct = tp_buy + tp_sell
+    total_signals = correct + fp_buy + fp_sell
     accuracy = correct / total_signals if total_signals > 0 else 0.0
 
     return {
@@ -219,32 +277,132 @@ def evaluate_thresholds(table: list[dict], buy_thresh: float, sell_thresh: float
     }
 
 
-def sweep_thresholds(table: list[dict]) -> list[dict]:
-    """Sweep across threshold combinations and min_articles values."""
+def _table_arrays(table: list[dict]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert the backtest table into (scores, changes, counts) arrays."""
+    n = len(table)
+    scores = np.fromiter((r["sentiment_score"] for r in table), dtype=np.float64, count=n)
+    changes = np.fromiter((r["actual_change_pct"] for r in table), dtype=np.float64, count=n)
+    counts = np.fromiter((r["article_count"] for r in table), dtype=np.int64, count=n)
+    return scores, changes, counts
+
+
+def sweep_thresholds(table: list[dict], buy_range: list[float] | None = None,
+                     sell_range: list[float] | None = None,
+                     min_articles_options: list[int] | None = None) -> list[dict]:
+    """Sweep across threshold combinations and min_articles values.
+
+    buy_range must be ascending and sell_range descending (default: 0.05 steps
+    out to +/-0.60). All (buy, sell) pairs for a given min_articles are evaluated
+    at once by broadcasting the table against the threshold grid. Combinations
+    that cannot produce a signal, or that repeat an earlier result exactly, are
+    pruned; callers only consider combinations with at least one signal and
+    keep the first of equally ranked results, so the chosen optimum is unchanged.
+    """
     results = []
-    buy_range = [round(x * 0.05, 2) for x in range(1, 13)]     # 0.05 to 0.60
-    sell_range = [round(-x * 0.05, 2) for x in range(1, 13)]    # -0.05 to -0.60
-    min_articles_options = [1, 2, 3, 5]
+    if buy_range is None:
+        buy_range = [round(x * 0.05, 2) for x in range(1, 13)]     # 0.05 to 0.60
+    if sell_range is None:
+        sell_range = [round(-x * 0.05, 2) for x in range(1, 13)]   # -0.05 to -0.60
+    if min_articles_options is None:
+        min_articles_options = MIN_ARTICLES_OPTIONS
+
+    all_scores, all_changes, counts = _table_arrays(table)
+    prev_valid = -1
 
     for min_art in min_articles_options:
-        for bt in buy_range:
-            for st in sell_range:
-                result = evaluate_thresholds(table, bt, st, min_art)
-                results.append(result)
+        valid = counts >= min_art
+        n_valid = int(np.count_nonzero(valid))
+        if n_valid == 0:
+            break  # higher min_articles can only select fewer rows
+        if n_valid == prev_valid:
+            continue  # same rows as the previous min_articles, same results
+        prev_valid = n_valid
+
+        scores = all_scores[valid]
+        went_up = all_changes[valid] > 0
+        went_down = all_changes[valid] < 0
+
+        # Thresholds are monotonic: every buy threshold at or above the top
+        # score yields no BUYs, so only the first of them is worth evaluating
+        # (likewise for sell thresholds at or below the bottom score)
+        n_buys = min(len(buy_range), sum(bt < scores.max() for bt in buy_range) + 1)
+        n_sells = min(len(sell_range), sum(st > scores.min() for st in sell_range) + 1)
+        buys = np.array(buy_range[:n_buys])[:, None, None]      # (B, 1, 1)
+        sells = np.array(sell_range[:n_sells])[None, :, None]   # (1, S, 1)
+
+        is_buy = scores > buys                      # (B, 1, N)
+        is_sell = ~is_buy & (scores < sells)        # (B, S, N)
+
+        tp_buy = (is_buy & went_up).sum(axis=-1)
+        n_buy = is_buy.sum(axis=-1)
+        tp_sell = (is_sell & went_down).sum(axis=-1)
+        n_sell = is_sell.sum(axis=-1)
+
+        for i, bt in enumerate(buy_range[:n_buys]):
+            for j, st in enumerate(sell_range[:n_sells]):
+                if n_buy[i, 0] + n_sell[i, j] == 0:
+                    continue
+                results.append(_threshold_result(
+                    bt, st, min_art,
+                    int(tp_buy[i, 0]), int(n_buy[i, 0] - tp_buy[i, 0]),
+                    int(tp_sell[i, j]), int(n_sell[i, j] - tp_sell[i, j]),
+                    len(table) - int(n_buy[i, 0]) - int(n_sell[i, j]),
+                ))
 
     return results
 
 
-def per_ticker_accuracy(table: list[dict], buy_thresh: float, sell_thresh: float,
-                        min_articles: int) -> dict[str, dict]:
-    """Compute accuracy per ticker."""
+def rank_viable(results: list[dict]) -> list[dict]:
+    """Return results with enough signals to trust, best first.
+
+    Results with at least 3 signals are preferred to avoid noise; if there are
+    none, anything with at least one signal is used. Sorted by accuracy, then
+    total_signals, both descending.
+    """
+    viable = [r for r in results if r["total_signals"] >= 3]
+    if not viable:
+        viable = [r for r in results if r["total_signals"] >= 1]
+    viable.sort(key=lambda r: (r["accuracy"], r["total_signals"]), reverse=True)
+    return viable
+
+
+def search_thresholds(table: list[dict]) -> list[dict]:
+    """Coarse-to-fine threshold search.
+
+    Sweeps a COARSE_STEP grid first, then re-sweeps a REFINE_STEP grid around
+    each of the REFINE_TOP_N best coarse results (at that result's min_articles).
+    Returns all evaluated results, coarse ones first.
+    """
+    coarse_buys = [round(x * COARSE_STEP, 2) for x in range(1, 7)]     # 0.1 to 0.6
+    coarse_sells = [round(-x * COARSE_STEP, 2) for x in range(1, 7)]   # -0.1 to -0.6
+    coarse = sweep_thresholds(table, coarse_buys, coarse_sells)
+
+    results = {(r["buy_threshold"], r["sell_threshold"], r["min_articles"]): r for r in coarse}
+    offsets = [k * REFINE_STEP for k in range(-REFINE_RADIUS, REFINE_RADIUS + 1)]
+    for top in rank_viable(coarse)[:REFINE_TOP_N]:
+        fine_buys = [b for b in (round(top["buy_threshold"] + o, 2) for o in offsets) if b > 0]
+        fine_sells = [s for s in (round(top["sell_threshold"] - o, 2) for o in offsets) if s < 0]
+        for r in sweep_thresholds(table, fine_buys, fine_sells, [top["min_articles"]]):
+            results.setdefault((r["buy_threshold"], r["sell_threshold"], r["min_articles"]), r)
+
+    return list(results.values())
+
+
+def group_by_ticker(table: list[dict]) -> dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Split the backtest table into per-ticker (scores, changes, counts) arrays."""
     by_ticker = defaultdict(list)
     for row in table:
         by_ticker[row["ticker"]].append(row)
+    return {ticker: _table_arrays(rows) for ticker, rows in sorted(by_ticker.items())}
 
+
+def per_ticker_accuracy(by_ticker: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]],
+                        buy_thresh: float, sell_thresh: float,
+                        min_articles: int) -> dict[str, dict]:
+    """Compute accuracy per ticker from the arrays returned by group_by_ticker."""
     ticker_stats = {}
-    for ticker, rows in sorted(by_ticker.items()):
-        stats = evaluate_thresholds(rows, buy_thresh, sell_thresh, min_articles)
+    for ticker, arrays in by_ticker.items():
+        stats = _evaluate_arrays(arrays, buy_thresh, sell_thresh, min_articles)
         stats["ticker"] = ticker
         ticker_stats[ticker] = stats
 
@@ -261,9 +419,10 @@ def print_report(table: list[dict], current: dict, optimal: dict,
     print(f"\nData points: {len(table)} ticker-date combinations")
     tickers_seen = set(r["ticker"] for r in table)
     print(f"Tickers with data: {len(tickers_seen)}")
-    date_range = sorted(set(r["date"] for r in table))
-    if date_range:
-        print(f"Date range: {date_range[0]} to {date_range[-1]}")
+    if table:
+        first = min(r["date"] for r in table)
+        last = max(r["date"] for r in table)
+        print(f"Date range: {first} to {last}")
 
     # --- Current thresholds ---
     print("\n" + "-" * 70)
@@ -369,24 +528,18 @@ def main():
     current = evaluate_thresholds(table, config.BUY_THRESHOLD, config.SELL_THRESHOLD,
                                   config.MIN_ARTICLES)
 
-    # Sweep for optimal
-    all_results = sweep_thresholds(table)
-    # Filter to results with at least 3 signals to avoid noise
-    viable = [r for r in all_results if r["total_signals"] >= 3]
-    if not viable:
-        viable = [r for r in all_results if r["total_signals"] >= 1]
+    # Search for optimal
+    viable = rank_viable(search_thresholds(table))
     if not viable:
         print("ERROR: No viable threshold combinations found.")
         return
-
-    # Sort by accuracy (desc), then by total_signals (desc) as tiebreaker
-    viable.sort(key=lambda r: (r["accuracy"], r["total_signals"]), reverse=True)
     optimal = viable[0]
 
-    # Per-ticker stats
-    ticker_stats_current = per_ticker_accuracy(table, config.BUY_THRESHOLD,
+    # Per-ticker stats (grouping is shared by both evaluations)
+    by_ticker = group_by_ticker(table)
+    ticker_stats_current = per_ticker_accuracy(by_ticker, config.BUY_THRESHOLD,
                                                config.SELL_THRESHOLD, config.MIN_ARTICLES)
-    ticker_stats_optimal = per_ticker_accuracy(table, optimal["buy_threshold"],
+    ticker_stats_optimal = per_ticker_accuracy(by_ticker, optimal["buy_threshold"],
                                                optimal["sell_threshold"],
                                                optimal["min_articles"])
 
@@ -396,15 +549,18 @@ def main():
     return optimal
 
 
-def auto_tune():
+def auto_tune(articles: list[dict] | None = None):
     """Run backtest and update config thresholds in memory if better ones are found.
 
-    Called automatically by the daily pipeline before signal generation.
+    Called automatically by the daily pipeline before signal generation. The
+    pipeline may pass articles it already got from collect_historical_news()
+    (and scored) so they aren't fetched again.
     Returns True if thresholds were updated, False otherwise.
     """
     logger.info("Auto-tune: running backtest to optimize thresholds...")
 
-    articles = collect_historical_news()
+    if articles is None:
+        articles = collect_historical_news()
     if not articles:
         logger.warning("Auto-tune: no articles collected, keeping current thresholds")
         return False
@@ -422,15 +578,10 @@ def auto_tune():
     current = evaluate_thresholds(table, config.BUY_THRESHOLD, config.SELL_THRESHOLD,
                                   config.MIN_ARTICLES)
 
-    all_results = sweep_thresholds(table)
-    viable = [r for r in all_results if r["total_signals"] >= 3]
-    if not viable:
-        viable = [r for r in all_results if r["total_signals"] >= 1]
+    viable = rank_viable(search_thresholds(table))
     if not viable:
         logger.warning("Auto-tune: no viable thresholds found, keeping current")
         return False
-
-    viable.sort(key=lambda r: (r["accuracy"], r["total_signals"]), reverse=True)
     optimal = viable[0]
 
     if optimal["accuracy"] > current["accuracy"]:
@@ -455,4 +606,11 @@ def auto_tune():
 
 
 if __name__ == "__main__":
+    # Only when run standalone: main.py configures logging for the bot, and a
+    # basicConfig here at import time would make its setup a no-op
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
     result = main()
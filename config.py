@@ -32,8 +32,25 @@ SEARCH_KEYWORDS = {
 YAHOO_RSS_URL = "https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US"
 BLOOMBERG_MARKETS_URL = "https://www.bloomberg.com/markets"
 
+# --- HTTP Cache ---
+# Yahoo RSS responses are cached on disk so back-to-back runs (auto-tune, pipeline,
+# dashboard refresh) don't re-download unchanged feeds
+HTTP_CACHE_PATH = "http_cache"  # SQLite file, ".sqlite" is appended
+HTTP_CACHE_EXPIRE_SECONDS = 1800
+
+# --- Sentiment Cache ---
+# FinBERT predictions persisted across runs (shelve database, keyed by a hash of the
+# model setup and article text). Use from one process at a time.
+SENTIMENT_CACHE_PATH = "sentiment_cache"
+
+# --- Sentiment Model ---
+# torch.compile FinBERT at load time. Off by default: compiling needs a C++
+# toolchain and costs more per process than it saves on a few hundred headlines.
+SENTIMENT_COMPILE = os.getenv("SENTIMENT_COMPILE", "").lower() in ("1", "true", "yes")
+
 # --- NewsAPI ---
 NEWSAPI_KEY = os.getenv("NEWSAPI_KEY", "")
+NEWSAPI_URL = "https://newsapi.org/v2/everything"
 NEWSAPI_DOMAINS = "reuters.com,cnbc.com,bloomberg.com,wsj.com,marketwatch.com,finance.yahoo.com"
 
 # --- Email ---
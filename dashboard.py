@@ -1,19 +1,21 @@
-import json
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
 import schedule
 from flask import Flask, render_template, redirect, url_for
 
 import config
-from news_collector import collect_all_news
+from news_collector import collect_all_news, fetch_yahoo_feeds
 from sentiment_analyzer import analyze_sentiment
 from signal_generator import generate_signals
 from email_sender import send_digest
-from backtester import auto_tune
+from backtester import auto_tune, collect_historical_news
+from main import flush_logs
 
 logger = logging.getLogger(__name__)
 
@@ -21,23 +23,47 @@ SIGNALS_FILE = Path(__file__).parent / "signals.json"
 
 app = Flask(__name__)
 
+# Parsed signals.json, reloaded only when the file's mtime changes
+_signals_cache = {"mtime": 0, "data": None}
+_signals_lock = threading.Lock()
+
 
 def run_pipeline_and_save():
     """Run the full pipeline and save signals to JSON."""
-    logger.info("Dashboard pipeline: starting...")
-    start = time.time()
+    try:
+        _run_pipeline_steps()
+    finally:
+        # Write the run's records out of the log buffer now rather than
+        # holding them in memory until the next run
+        flush_logs()
+
 
+def _run_pipeline_steps():
+    logger.info("Dashboard pipeline: starting...")
+    start = time.perf_counter()
+
+    # Collect today's news and the auto-tune history from one fetch of the
+    # Yahoo RSS feeds
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        # Bloomberg and NewsAPI are queried while the feeds are fetched
+        yahoo_feeds = ex.submit(fetch_yahoo_feeds)
+        articles = collect_all_news(yahoo_feeds)
     try:
-        auto_tune()
+        history = collect_historical_news(yahoo_feeds.result())
     except Exception:
-        logger.exception("Auto-tune failed, continuing with current thresholds")
-
-    articles = collect_all_news()
+        logger.exception("Collecting backtest history failed")
+        history = []
     if not articles:
         logger.warning("No articles collected. Skipping pipeline.")
         return
 
-    articles = analyze_sentiment(articles)
+    # One FinBERT pass over both sets; auto_tune then only hits the cache
+    analyze_sentiment(history + articles)
+    try:
+        auto_tune(history)
+    except Exception:
+        logger.exception("Auto-tune failed, continuing with current thresholds")
+
     signals = generate_signals(articles)
 
     # Send email digest too
@@ -51,18 +77,23 @@ def run_pipeline_and_save():
         "last_updated": datetime.now(timezone.utc).isoformat(),
         "signals": signals,
     }
-    SIGNALS_FILE.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+    SIGNALS_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
 
-    elapsed = time.time() - start
+    elapsed = time.perf_counter() - start
     logger.info("Dashboard pipeline completed in %.1f seconds", elapsed)
 
 
 def _scheduler_loop():
     """Background thread: run pipeline on schedule."""
     schedule.every().day.at(config.DAILY_RUN_TIME).do(run_pipeline_and_save)
+    # Sleep exactly until the next run instead of polling every minute
     while True:
+        idle = schedule.idle_seconds()
+        if idle is None:
+            break  # no jobs scheduled
+        if idle > 0:
+            time.sleep(idle)
         schedule.run_pending()
-        time.sleep(60)
 
 
 def start_background_scheduler():
@@ -73,22 +104,35 @@ def start_background_scheduler():
     threading.Thread(target=_scheduler_loop, daemon=True).start()
 
 
+def _load_signals() -> dict | None:
+    """Return the parsed signals.json, or None if it doesn't exist yet."""
+    try:
+        mtime = SIGNALS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    with _signals_lock:
+        if mtime != _signals_cache["mtime"]:
+            _signals_cache["data"] = orjson.loads(SIGNALS_FILE.read_bytes())
+            _signals_cache["mtime"] = mtime
+        return _signals_cache["data"]
+
+
 @app.route("/")
 def index():
     """Serve the dashboard page."""
     signals = {}
     last_updated = "Never (pipeline running...)"
 
-    if SIGNALS_FILE.exists():
-        try:
-            data = json.loads(SIGNALS_FILE.read_text(encoding="utf-8"))
+    try:
+        data = _load_signals()
+        if data is not None:
             signals = data.get("signals", {})
             raw_ts = data.get("last_updated", "")
             if raw_ts:
                 dt = datetime.fromisoformat(raw_ts)
                 last_updated = dt.strftime("%B %d, %Y at %H:%M UTC")
-        except Exception:
-            logger.exception("Failed to read signals.json")
+    except Exception:
+        logger.exception("Failed to read signals.json")
 
     sections = [
         ("Stocks", config.STOCKS),
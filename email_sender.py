@@ -1,5 +1,6 @@
 import logging
 import smtplib
+import threading
 from datetime import datetime, timezone
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -77,7 +78,64 @@ EMAIL_TEMPLATE = Template("""\
 </div>
 </body>
 </html>
-""")
+""", autoescape=True)
+
+
+class _SMTPPool:
+    """A lazily opened SMTP connection reused across digests.
+
+    The connection is health-checked with NOOP before each send and
+    re-established (including login) if the server has dropped it.
+    """
+
+    def __init__(self):
+        self._server = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(config.SMTP_HOST, config.SMTP_PORT, timeout=30)
+        try:
+            server.starttls()
+            server.login(config.GMAIL_ADDRESS, config.GMAIL_APP_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _is_alive(self) -> bool:
+        try:
+            return self._server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _close(self):
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._server = None
+
+    def send(self, msg: MIMEMultipart):
+        with self._lock:
+            try:
+                if self._server is None or not self._is_alive():
+                    self._close()
+                    self._server = self._connect()
+                try:
+                    self._server.send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # Dropped between the health check and the send: reconnect once
+                    self._close()
+                    self._server = self._connect()
+                    self._server.send_message(msg)
+            except Exception:
+                self._close()
+                raise
+
+
+_smtp_pool = _SMTPPool()
 
 
 def send_digest(signals: dict[str, dict]) -> bool:
@@ -105,10 +163,7 @@ def send_digest(signals: dict[str, dict]) -> bool:
     msg.attach(MIMEText(html, "html"))
 
     try:
-        with smtplib.SMTP(config.SMTP_HOST, config.SMTP_PORT, timeout=30) as server:
-            server.starttls()
-            server.login(config.GMAIL_ADDRESS, config.GMAIL_APP_PASSWORD)
-            server.send_message(msg)
+        _smtp_pool.send(msg)
         logger.info("Digest email sent to %s", config.RECIPIENT_EMAIL)
         return True
     except Exception:
@@ -2,61 +2,89 @@ import argparse
 import logging
 import sys
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from logging.handlers import MemoryHandler
 
 import schedule
 
 import config
-from news_collector import collect_all_news
+from news_collector import collect_all_news, fetch_yahoo_feeds
 from sentiment_analyzer import analyze_sentiment
 from signal_generator import generate_signals
 from email_sender import send_digest
-from backtester import auto_tune
+from backtester import auto_tune, collect_historical_news
 from publish import publish_to_github_pages
 
 
 def setup_logging():
     fmt = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    file_handler = logging.FileHandler(config.LOG_FILE, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter(fmt))
     handlers = [
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler(config.LOG_FILE, encoding="utf-8"),
+        # Buffer file writes; flushed every 200 records, on errors, and at exit
+        MemoryHandler(capacity=200, flushLevel=logging.ERROR, target=file_handler),
     ]
     logging.basicConfig(level=logging.INFO, format=fmt, handlers=handlers)
 
 
+def flush_logs():
+    """Write buffered log records (see setup_logging) to the log file."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
 def run_pipeline():
     """Execute the full news -> sentiment -> signals -> email pipeline."""
+    try:
+        _run_pipeline_steps()
+    finally:
+        # A run logs fewer records than the buffer holds, so write them out now
+        # rather than keeping them in memory until the next run
+        flush_logs()
+
+
+def _run_pipeline_steps():
     logger = logging.getLogger("pipeline")
-    start = time.time()
+    start = time.perf_counter()
     logger.info("=" * 60)
     logger.info("Starting signal generation pipeline at %s", datetime.now(timezone.utc).isoformat())
 
-    # Step 0: Auto-tune thresholds from recent backtest data
-    logger.info("Step 0/5: Auto-tuning signal thresholds...")
+    # Step 1: Collect today's news and the auto-tune history. Both are built
+    # from one fetch of the Yahoo RSS feeds
+    logger.info("Step 1/5: Collecting news and backtest history...")
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        # Bloomberg and NewsAPI are queried while the feeds are fetched
+        yahoo_feeds = ex.submit(fetch_yahoo_feeds)
+        articles = collect_all_news(yahoo_feeds)
     try:
-        auto_tune()
+        history = collect_historical_news(yahoo_feeds.result())
     except Exception:
-        logger.exception("Auto-tune failed, continuing with current thresholds")
-
-    logger.info("Step 1/5: Collecting news...")
-    articles = collect_all_news()
+        logger.exception("Collecting backtest history failed")
+        history = []
     if not articles:
         logger.warning("No articles collected. Skipping pipeline.")
         return
 
-    # Step 2: Sentiment analysis
-    logger.info("Step 2/5: Running sentiment analysis on %d articles...", len(articles))
-    articles = analyze_sentiment(articles)
+    # Step 2: Sentiment analysis (one FinBERT pass over both sets)
+    logger.info("Step 2/5: Running sentiment analysis on %d articles...",
+                len(articles) + len(history))
+    analyze_sentiment(history + articles)
 
-    # Step 3: Generate signals
-    logger.info("Step 3/5: Generating trading signals...")
+    # Step 3: Auto-tune thresholds from recent backtest data, then generate signals
+    logger.info("Step 3/5: Auto-tuning thresholds and generating trading signals...")
+    try:
+        auto_tune(history)
+    except Exception:
+        logger.exception("Auto-tune failed, continuing with current thresholds")
     signals = generate_signals(articles)
 
     # Print summary
-    buy_count = sum(1 for s in signals.values() if s["signal"] == "BUY")
-    sell_count = sum(1 for s in signals.values() if s["signal"] == "SELL")
-    hold_count = sum(1 for s in signals.values() if s["signal"] == "HOLD")
-    logger.info("Signals summary: %d BUY, %d SELL, %d HOLD", buy_count, sell_count, hold_count)
+    counts = Counter(s["signal"] for s in signals.values())
+    logger.info("Signals summary: %d BUY, %d SELL, %d HOLD",
+                counts["BUY"], counts["SELL"], counts["HOLD"])
 
     # Step 4: Send email
     logger.info("Step 4/5: Sending email digest...")
@@ -73,7 +101,7 @@ def run_pipeline():
     except Exception:
         logger.exception("Failed to publish to GitHub Pages")
 
-    elapsed = time.time() - start
+    elapsed = time.perf_counter() - start
     logger.info("Pipeline completed in %.1f seconds", elapsed)
     logger.info("=" * 60)
 
@@ -106,9 +134,14 @@ def main():
     logger.info("Press Ctrl+C to stop")
 
     try:
+        # Sleep exactly until the next scheduled job instead of polling
         while True:
+            idle = schedule.idle_seconds()
+            if idle is None:
+                break  # no jobs scheduled
+            if idle > 0:
+                time.sleep(idle)
             schedule.run_pending()
-            time.sleep(60)
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
 
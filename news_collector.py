@@ -1,9 +1,15 @@
 import logging
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from xml.etree import ElementTree
 
 import feedparser
-import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+from simhash import Simhash, SimhashIndex
 
 import config
 
@@ -17,28 +23,168 @@ HEADERS = {
     )
 }
 
+# Shared keep-alive session for every HTTP call (RSS, Bloomberg, NewsAPI),
+# pooled so the concurrent collectors reuse connections per host. Yahoo RSS
+# responses are served from the on-disk cache for HTTP_CACHE_EXPIRE_SECONDS;
+# the Bloomberg page is stored but always revalidated. Once stale, a cached
+# response with an ETag/Last-Modified is revalidated with a conditional
+# request, so an unchanged feed comes back as a bodiless 304. NewsAPI and
+# anything else goes straight to the network.
+SESSION = requests_cache.CachedSession(
+    config.HTTP_CACHE_PATH,
+    backend="sqlite",
+    expire_after=requests_cache.DO_NOT_CACHE,
+    urls_expire_after={
+        "feeds.finance.yahoo.com/rss": config.HTTP_CACHE_EXPIRE_SECONDS,
+        "www.bloomberg.com/markets": requests_cache.EXPIRE_IMMEDIATELY,
+    },
+)
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
 
-def collect_yahoo_rss(ticker: str) -> list[dict]:
-    """Fetch headlines from Yahoo Finance RSS for a given ticker."""
-    articles = []
+# Concurrent Yahoo RSS requests (one per ticker)
+RSS_WORKERS = min(16, len(config.ALL_TICKERS))
+
+# Titles are SimHashed over overlapping character shingles of this length
+SHINGLE_SIZE = 3
+# Titles of the same asset whose 64-bit SimHashes differ in at most this many
+# bits are duplicates. Tuned on headline rewordings (inserted/dropped words,
+# synonyms, source suffixes): 8 bits catches ~60% of them. A one-word flip
+# like "gains"/"drops" can land just as close, hence the direction words below.
+SIMHASH_MAX_DISTANCE = 8
+
+# Price-direction words. Near-duplicate titles are only merged when they agree
+# on which of these groups they mention, so "X stock gains in premarket
+# trading" never swallows "X stock drops in premarket trading".
+_UP_WORDS = frozenset({
+    "rise", "rises", "rose", "gain", "gains", "climb", "climbs", "jump", "jumps",
+    "surge", "surges", "soar", "soars", "rally", "rallies", "rebound", "rebounds",
+    "beat", "beats", "top", "tops", "raise", "raises", "raised", "upgrade", "upgraded",
+    "bullish", "high", "higher", "up", "boost", "boosts", "lift", "lifts",
+})
+_DOWN_WORDS = frozenset({
+    "fall", "falls", "fell", "drop", "drops", "slide", "slides", "slip", "slips",
+    "dip", "dips", "plunge", "plunges", "tumble", "tumbles", "slump", "slumps",
+    "sink", "sinks", "miss", "misses", "cut", "cuts", "lower", "lowered",
+    "downgrade", "downgraded", "bearish", "low", "down", "short", "weak", "weakens",
+})
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Commodity/crypto keywords that map a headline to a watched asset
+_KEYWORD_MAP = {
+    "GOLD": "GC=F", "CRUDE": "CL=F", "OIL": "CL=F", "SILVER": "SI=F",
+    "BITCOIN": "BTC-USD", "BTC": "BTC-USD",
+    "ETHEREUM": "ETH-USD", "ETH": "ETH-USD",
+}
+
+# (pattern, ticker) in match priority order: stock tickers, then keywords.
+# The lookahead lets finditer report overlapping matches in a single pass,
+# and at each position the alternation picks the highest-priority pattern.
+# Each pattern is its own group, so m.lastindex - 1 is its rank, and the scan
+# is case-insensitive so headlines needn't be upper-cased first.
+_MATCH_PATTERNS = [(t.upper(), t) for t in config.STOCKS] + list(_KEYWORD_MAP.items())
+_MATCH_RE = re.compile(
+    "(?=" + "|".join(f"({re.escape(p)})" for p, _ in _MATCH_PATTERNS) + ")",
+    re.IGNORECASE,
+)
+
+
+def parse_rss(content: bytes) -> list[dict]:
+    """Extract title, summary, link and published (UTC datetime or None) per RSS item.
+
+    Well-formed RSS 2.0 (what Yahoo serves) is read directly with ElementTree,
+    skipping feedparser's sanitization passes; anything else falls back to feedparser.
+    """
+    try:
+        root = ElementTree.fromstring(content)
+    except ElementTree.ParseError:
+        root = None
+    if root is None or root.tag != "rss":
+        return _parse_feed_fallback(content)
+
+    entries = []
+    for item in root.iter("item"):
+        published = None
+        pub_date = item.findtext("pubDate")
+        if pub_date:
+            try:
+                published = parsedate_to_datetime(pub_date)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if published.tzinfo is None:
+                    published = published.replace(tzinfo=timezone.utc)
+                published = published.astimezone(timezone.utc)
+        entries.append({
+            "title": (item.findtext("title") or "").strip(),
+            "summary": (item.findtext("description") or "").strip(),
+            "link": (item.findtext("link") or "").strip(),
+            "published": published,
+        })
+    return entries
+
+
+def _parse_feed_fallback(content: bytes) -> list[dict]:
+    """parse_rss() via feedparser, for feeds ElementTree can't read."""
+    entries = []
+    for entry in feedparser.parse(content).entries:
+        published = None
+        if hasattr(entry, "published_parsed") and entry.published_parsed:
+            published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+        entries.append({
+            "title": entry.get("title", ""),
+            "summary": entry.get("summary", ""),
+            "link": entry.get("link", ""),
+            "published": published,
+        })
+    return entries
+
+
+def fetch_yahoo_feed(ticker: str) -> list[dict]:
+    """Fetch and parse the Yahoo Finance RSS feed for a given ticker."""
     url = config.YAHOO_RSS_URL.format(ticker=ticker)
     try:
-        feed = feedparser.parse(url)
-        for entry in feed.entries:
-            published = None
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc).isoformat()
-            articles.append({
-                "title": entry.get("title", ""),
-                "summary": entry.get("summary", ""),
-                "source": "Yahoo Finance",
-                "ticker": ticker,
-                "published": published,
-                "link": entry.get("link", ""),
-            })
-        logger.info("Yahoo RSS for %s: %d articles", ticker, len(articles))
+        resp = SESSION.get(url, timeout=15)
+        resp.raise_for_status()
+        entries = parse_rss(resp.content)
+        logger.info("Yahoo RSS for %s: %d articles", ticker, len(entries))
+        return entries
     except Exception:
         logger.exception("Error fetching Yahoo RSS for %s", ticker)
+        return []
+
+
+def fetch_yahoo_feeds(tickers: list[str] | None = None) -> dict[str, list[dict]]:
+    """Fetch and parse the Yahoo Finance RSS feeds concurrently, keyed by ticker.
+
+    The pipeline fetches the feeds once and builds both today's articles
+    (collect_all_news) and the backtest history (collect_historical_news) from them.
+    """
+    tickers = config.ALL_TICKERS if tickers is None else tickers
+    with ThreadPoolExecutor(max_workers=RSS_WORKERS) as ex:
+        return dict(zip(tickers, ex.map(fetch_yahoo_feed, tickers)))
+
+
+def collect_yahoo_rss(ticker: str, entries: list[dict] | None = None) -> list[dict]:
+    """Build headline articles from the Yahoo Finance RSS feed for a given ticker.
+
+    Pass already fetched feed entries to skip the request.
+    """
+    if entries is None:
+        entries = fetch_yahoo_feed(ticker)
+    articles = []
+    for entry in entries:
+        published = entry["published"]
+        articles.append({
+            "title": entry["title"],
+            "summary": entry["summary"],
+            "source": "Yahoo Finance",
+            "ticker": ticker,
+            "published": published.isoformat() if published else None,
+            "link": entry["link"],
+        })
     return articles
 
 
@@ -46,12 +192,14 @@ def collect_bloomberg() -> list[dict]:
     """Scrape public headlines from Bloomberg markets page."""
     articles = []
     try:
-        resp = requests.get(config.BLOOMBERG_MARKETS_URL, headers=HEADERS, timeout=15)
+        resp = SESSION.get(config.BLOOMBERG_MARKETS_URL, timeout=15)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        tree = LexborHTMLParser(resp.text)
+        # Headlines from one scrape share the scrape time as their timestamp
+        now_iso = datetime.now(timezone.utc).isoformat()
         # Bloomberg uses various headline tags; grab article titles
-        for tag in soup.find_all(["h1", "h2", "h3", "a"], limit=50):
-            text = tag.get_text(strip=True)
+        for node in tree.css("h1, h2, h3, a")[:50]:
+            text = node.text(strip=True)
             if len(text) < 15 or len(text) > 300:
                 continue
             # Try to match to a watched asset
@@ -62,7 +210,7 @@ def collect_bloomberg() -> list[dict]:
                     "summary": "",
                     "source": "Bloomberg",
                     "ticker": matched_ticker,
-                    "published": datetime.now(timezone.utc).isoformat(),
+                    "published": now_iso,
                     "link": "",
                 })
         logger.info("Bloomberg: %d matched articles", len(articles))
@@ -71,92 +219,162 @@ def collect_bloomberg() -> list[dict]:
     return articles
 
 
+def _query_newsapi(ticker: str, keywords: str, from_date: str) -> list[dict]:
+    """Fetch NewsAPI articles for one watched asset."""
+    articles = []
+    try:
+        resp = SESSION.get(
+            config.NEWSAPI_URL,
+            params={
+                "q": keywords,
+                "domains": config.NEWSAPI_DOMAINS,
+                "from": from_date,
+                "language": "en",
+                "sortBy": "relevancy",
+                "pageSize": 10,
+            },
+            headers={"X-Api-Key": config.NEWSAPI_KEY},
+            timeout=15,
+        )
+        result = resp.json()
+        if result.get("status") != "ok":
+            logger.error("NewsAPI error for %s: %s", keywords, result.get("message", resp.status_code))
+            return articles
+        for art in result.get("articles", []):
+            articles.append({
+                "title": art.get("title", "") or "",
+                "summary": art.get("description", "") or "",
+                "source": f"NewsAPI ({(art.get('source') or {}).get('name', 'Unknown')})",
+                "ticker": ticker,
+                "published": art.get("publishedAt", ""),
+                "link": art.get("url", ""),
+            })
+        logger.info("NewsAPI for %s: %d articles", ticker, len(articles))
+    except Exception:
+        logger.exception("Error querying NewsAPI for %s", keywords)
+    return articles
+
+
 def collect_newsapi() -> list[dict]:
     """Fetch articles from NewsAPI for all watched assets."""
     if not config.NEWSAPI_KEY:
         logger.warning("NewsAPI key not configured, skipping")
         return []
 
-    articles = []
     from_date = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
 
-    try:
-        from newsapi import NewsApiClient
-        api = NewsApiClient(api_key=config.NEWSAPI_KEY)
-    except Exception:
-        logger.exception("Failed to initialize NewsAPI client")
-        return []
-
-    for ticker, keywords in config.SEARCH_KEYWORDS.items():
-        try:
-            result = api.get_everything(
-                q=keywords,
-                domains=config.NEWSAPI_DOMAINS,
-                from_param=from_date,
-                language="en",
-                sort_by="relevancy",
-                page_size=10,
-            )
-            for art in result.get("articles", []):
-                articles.append({
-                    "title": art.get("title", ""),
-                    "summary": art.get("description", "") or "",
-                    "source": f"NewsAPI ({art.get('source', {}).get('name', 'Unknown')})",
-                    "ticker": ticker,
-                    "published": art.get("publishedAt", ""),
-                    "link": art.get("url", ""),
-                })
-            logger.info("NewsAPI for %s: %d articles", ticker, len(result.get("articles", [])))
-        except Exception:
-            logger.exception("Error querying NewsAPI for %s", keywords)
+    # One request per asset, fanned out over the shared pooled session
+    articles = []
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = [ex.submit(_query_newsapi, ticker, keywords, from_date)
+                   for ticker, keywords in config.SEARCH_KEYWORDS.items()]
+        for future in futures:
+            articles.extend(future.result())
     return articles
 
 
 def _match_ticker(text: str) -> str | None:
     """Check if a headline mentions any watched asset."""
-    text_upper = text.upper()
-    # Check stock tickers
-    for ticker in config.STOCKS:
-        if ticker in text_upper:
-            return ticker
-    # Check commodity/crypto keywords
-    keyword_map = {
-        "GOLD": "GC=F", "CRUDE": "CL=F", "OIL": "CL=F", "SILVER": "SI=F",
-        "BITCOIN": "BTC-USD", "BTC": "BTC-USD",
-        "ETHEREUM": "ETH-USD", "ETH": "ETH-USD",
-    }
-    for keyword, ticker in keyword_map.items():
-        if keyword in text_upper:
-            return ticker
-    return None
+    # One scan finds every pattern occurrence; the lowest-ranked one wins so
+    # stock tickers still take precedence over commodity/crypto keywords
+    best = None
+    for m in _MATCH_RE.finditer(text):
+        rank = m.lastindex - 1
+        if best is None or rank < best:
+            best = rank
+            if rank == 0:
+                break
+    return _MATCH_PATTERNS[best][1] if best is not None else None
+
+
+def _title_simhash(normalized: str) -> Simhash:
+    """64-bit SimHash of a normalized title's character shingles."""
+    text = " ".join(normalized.split())
+    return Simhash([text[i : i + SHINGLE_SIZE] for i in range(max(len(text) - SHINGLE_SIZE + 1, 1))])
+
+
+def _title_direction(normalized: str) -> tuple[bool, bool]:
+    """Whether a normalized title mentions up-words and down-words."""
+    words = set(_WORD_RE.findall(normalized))
+    return bool(words & _UP_WORDS), bool(words & _DOWN_WORDS)
 
 
 def _deduplicate(articles: list[dict]) -> list[dict]:
-    """Remove duplicate articles based on title similarity."""
+    """Remove duplicate articles based on title similarity.
+
+    Exact repeats are caught by a set of normalized titles; reworded
+    near-duplicates by a 64-bit SimHash of the title's character shingles,
+    within SIMHASH_MAX_DISTANCE bits of an already kept title about the same
+    asset that points in the same direction.
+
+    >>> def titles(*ts):
+    ...     return [a["title"] for a in _deduplicate([{"title": t, "ticker": k} for k, t in ts])]
+    >>> titles(("AAPL", "Apple beats Q3 earnings expectations"),
+    ...        ("AAPL", "Apple Inc. beats Q3 earnings expectations"))
+    ['Apple beats Q3 earnings expectations']
+    >>> titles(("AAPL", "AAPL stock rises 2% in premarket trading"),
+    ...        ("MSFT", "MSFT stock rises 2% in premarket trading"))
+    ['AAPL stock rises 2% in premarket trading', 'MSFT stock rises 2% in premarket trading']
+    >>> titles(("TSLA", "Tesla stock gains in premarket trading"),
+    ...        ("TSLA", "Tesla stock drops in premarket trading"))
+    ['Tesla stock gains in premarket trading', 'Tesla stock drops in premarket trading']
+    """
     seen_titles = set()
+    # One SimHash index per asset: headlines written to the same template
+    # about different assets are not duplicates
+    indexes: dict[str, SimhashIndex] = {}
+    directions: dict[str, tuple[bool, bool]] = {}
     unique = []
-    for art in articles:
+    for i, art in enumerate(articles):
         # Normalize title for comparison
         normalized = art["title"].strip().lower()
-        if normalized and normalized not in seen_titles:
-            seen_titles.add(normalized)
-            unique.append(art)
+        if not normalized or normalized in seen_titles:
+            continue
+        signature = _title_simhash(normalized)
+        direction = _title_direction(normalized)
+        index = indexes.get(art["ticker"])
+        if index is None:
+            index = indexes[art["ticker"]] = SimhashIndex([], f=64, k=SIMHASH_MAX_DISTANCE)
+        if any(directions[dup] == direction for dup in index.get_near_dups(signature)):
+            continue
+        seen_titles.add(normalized)
+        index.add(str(i), signature)
+        directions[str(i)] = direction
+        unique.append(art)
     return unique
 
 
-def collect_all_news() -> list[dict]:
-    """Collect news from all sources, deduplicate, and return."""
+def collect_all_news(yahoo_feeds: dict[str, list[dict]] | Future | None = None) -> list[dict]:
+    """Collect news from all sources, deduplicate, and return.
+
+    yahoo_feeds, as returned by fetch_yahoo_feeds(), reuses already fetched
+    Yahoo RSS feeds instead of requesting them again. It may also be a Future
+    of them, in which case Bloomberg and NewsAPI are queried while the feeds
+    are still being fetched.
+    """
     all_articles = []
 
-    # Yahoo Finance RSS per ticker
-    for ticker in config.ALL_TICKERS:
-        all_articles.extend(collect_yahoo_rss(ticker))
+    # All sources are IO-bound, so fetch them concurrently; results are
+    # combined in a fixed order to keep deduplication deterministic
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        bloomberg = ex.submit(collect_bloomberg)
+        newsapi = ex.submit(collect_newsapi)
+
+        # Yahoo Finance RSS per ticker
+        if yahoo_feeds is None:
+            yahoo = ex.map(collect_yahoo_rss, config.ALL_TICKERS)
+        else:
+            if isinstance(yahoo_feeds, Future):
+                yahoo_feeds = yahoo_feeds.result()
+            yahoo = (collect_yahoo_rss(t, yahoo_feeds.get(t, [])) for t in config.ALL_TICKERS)
+        for articles in yahoo:
+            all_articles.extend(articles)
 
-    # Bloomberg public headlines
-    all_articles.extend(collect_bloomberg())
+        # Bloomberg public headlines
+        all_articles.extend(bloomberg.result())
 
-    # NewsAPI
-    all_articles.extend(collect_newsapi())
+        # NewsAPI
+        all_articles.extend(newsapi.result())
 
     # Filter out articles with empty titles
     all_articles = [a for a in all_articles if a["title"].strip()]
@@ -1,11 +1,12 @@
-import json
 import logging
 import os
 import subprocess
+import threading
 from datetime import datetime, timezone
+from html import escape
 from pathlib import Path
 
-from jinja2 import Template
+import orjson
 
 import config
 
@@ -15,7 +16,9 @@ PROJECT_DIR = Path(__file__).parent
 SIGNALS_FILE = PROJECT_DIR / "signals.json"
 OUTPUT_FILE = PROJECT_DIR / "docs" / "index.html"
 
-PAGE_TEMPLATE = Template("""\
+# The page is fixed apart from the timestamp and signal rows, so the static
+# head and foot are plain strings and only the sections are formatted per run.
+_HEAD = """\
 <!DOCTYPE html>
 <html>
 <head>
@@ -61,14 +64,21 @@ PAGE_TEMPLATE = Template("""\
     <p>Automated signals powered by FinBERT sentiment analysis</p>
   </div>
 
-  <div class="updated-bar">
-    Last updated: {{ last_updated }}
+"""
+
+_FOOT = """\
+  <div class="footer">
+    <p><strong>Disclaimer:</strong> This is not financial advice. Signals are generated
+    by automated sentiment analysis and should not be the sole basis for investment decisions.
+    Always do your own research.</p>
+    <p>Last updated: {last_updated}</p>
   </div>
+</div>
+</body>
+</html>
+"""
 
-  {% for section_name, tickers in sections %}
-  <div class="section">
-    <h2>{{ section_name }}</h2>
-    <table>
+_TABLE_HEADER = """\
       <tr>
         <th>Asset</th>
         <th>Signal</th>
@@ -77,33 +87,43 @@ PAGE_TEMPLATE = Template("""\
         <th>Articles</th>
         <th>Top Headline</th>
       </tr>
-      {% for ticker in tickers %}
-      {% if ticker in signals %}
-      {% set s = signals[ticker] %}
+"""
+
+
+def _render_row(s: dict) -> str:
+    """Render one signal's table row."""
+    headline = escape(s['top_headline'])
+    return f"""\
       <tr>
-        <td><strong>{{ s.display_name }}</strong></td>
-        <td class="{{ s.signal | lower }}">{{ s.signal }}</td>
-        <td>{{ "%.2f" | format(s.score | float) }}</td>
-        <td>{{ s.confidence }}%</td>
-        <td>{{ s.article_count }}</td>
-        <td class="headline" title="{{ s.top_headline }}">{{ s.top_headline }}</td>
+        <td><strong>{escape(s['display_name'])}</strong></td>
+        <td class="{s['signal'].lower()}">{s['signal']}</td>
+        <td>{float(s['score']):.2f}</td>
+        <td>{s['confidence']}%</td>
+        <td>{s['article_count']}</td>
+        <td class="headline" title="{headline}">{headline}</td>
       </tr>
-      {% endif %}
-      {% endfor %}
-    </table>
+"""
+
+
+def _render_page(last_updated: str, sections: list, signals: dict) -> str:
+    """Render the dashboard page: static head, one table per section, static foot."""
+    parts = [_HEAD, f"""\
+  <div class="updated-bar">
+    Last updated: {last_updated}
   </div>
-  {% endfor %}
 
-  <div class="footer">
-    <p><strong>Disclaimer:</strong> This is not financial advice. Signals are generated
-    by automated sentiment analysis and should not be the sole basis for investment decisions.
-    Always do your own research.</p>
-    <p>Last updated: {{ last_updated }}</p>
+"""]
+    for section_name, tickers in sections:
+        rows = "".join(_render_row(signals[ticker]) for ticker in tickers if ticker in signals)
+        parts.append(f"""\
+  <div class="section">
+    <h2>{section_name}</h2>
+    <table>
+{_TABLE_HEADER}{rows}    </table>
   </div>
-</div>
-</body>
-</html>
 """)
+    parts.append("\n" + _FOOT.format(last_updated=last_updated))
+    return "".join(parts)
 
 
 def publish_to_github_pages(signals: dict):
@@ -117,11 +137,7 @@ def publish_to_github_pages(signals: dict):
         ("Crypto", list(config.CRYPTO.values())),
     ]
 
-    html = PAGE_TEMPLATE.render(
-        last_updated=last_updated,
-        sections=sections,
-        signals=signals,
-    )
+    html = _render_page(last_updated, sections, signals)
 
     # Save static HTML
     OUTPUT_FILE.parent.mkdir(exist_ok=True)
@@ -130,7 +146,7 @@ def publish_to_github_pages(signals: dict):
 
     # Also save signals.json for reference
     data = {"last_updated": now.isoformat(), "signals": signals}
-    SIGNALS_FILE.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+    SIGNALS_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
 
     # Git commit and push (skip when running in GitHub Actions - workflow handles it)
     if os.getenv("GITHUB_ACTIONS"):
@@ -144,7 +160,26 @@ def publish_to_github_pages(signals: dict):
             ["git", "commit", "-m", f"Update signals - {now.strftime('%Y-%m-%d %H:%M UTC')}"],
             cwd=PROJECT_DIR, check=True, capture_output=True,
         )
+    except subprocess.CalledProcessError as e:
+        logger.error("Git commit failed: %s", e.stderr.decode() if e.stderr else str(e))
+        return
+
+    # Push is network-bound, so don't block the pipeline on it. The thread is
+    # non-daemon: a --now run still waits for the push before exiting.
+    threading.Thread(target=_git_push, name="git-push").start()
+    logger.info("Committed dashboard update, pushing to GitHub Pages in background")
+
+
+def _git_push():
+    """Push the committed dashboard update (runs on a background thread)."""
+    try:
         subprocess.run(["git", "push"], cwd=PROJECT_DIR, check=True, capture_output=True)
         logger.info("Pushed updated dashboard to GitHub Pages")
     except subprocess.CalledProcessError as e:
         logger.error("Git push failed: %s", e.stderr.decode() if e.stderr else str(e))
+    finally:
+        # The pipeline has already flushed the log buffer by now; write the
+        # outcome out too instead of leaving it buffered until the next run.
+        # Imported here because main imports this module.
+        from main import flush_logs
+        flush_logs()
@@ -1,28 +1,170 @@
+import hashlib
 import logging
+import shelve
+import threading
+from collections import Counter
 
 import torch
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 
+import config
+
 logger = logging.getLogger(__name__)
 
 MODEL_NAME = "ProsusAI/finbert"
 
+# Headlines plus summaries rarely exceed this many tokens; attention cost is
+# quadratic in sequence length, so don't pad/truncate to BERT's full 512
+MAX_LENGTH = 256
+
+# Pad batches to a multiple of this many tokens, so sequence lengths fall into
+# a few aligned buckets that the matmul kernels handle efficiently
+PAD_MULTIPLE = 32
+
+BATCH_SIZE = 16
+
 _tokenizer = None
 _model = None
+_eager_model = None  # uncompiled model, the fallback if the compiled one fails
+_DEVICE = "cpu"  # set to "cuda" by _load_model when a GPU is available
+_model_lock = threading.Lock()
+
+# Persistent (sentiment, confidence) cache keyed by model setup and article
+# text, so headlines seen in an earlier run, or already scored by auto_tune,
+# skip inference. The shelf is only opened briefly, to read and then to write
+# back a call's results; the lock serializes the dashboard's threads. It is
+# meant for one process at a time: if another process holds it (or it can't
+# be read), the call just runs uncached.
+_cache_lock = threading.Lock()
 
 
 def _load_model():
-    """Lazy-load FinBERT model and tokenizer."""
-    global _tokenizer, _model
-    if _tokenizer is None:
+    """Lazy-load FinBERT model and tokenizer.
+
+    Concurrent callers wait on the lock, and the globals are only published
+    once the model is fully prepared, so no thread sees a half-loaded model.
+    """
+    global _tokenizer, _model, _eager_model, _DEVICE
+    with _model_lock:
+        if _model is not None:
+            return
         logger.info("Loading FinBERT model (first run may download ~500MB)...")
-        _tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
-        _model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME)
-        _model.eval()
-        logger.info("FinBERT model loaded")
+        tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
+        model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME)
+        model.eval()
+        if torch.cuda.is_available():
+            _DEVICE = "cuda"
+            model.to(_DEVICE)
+        else:
+            # int8 dynamic quantization of the Linear layers: ~2-4x faster CPU
+            # inference and a ~4x smaller model, with negligible accuracy loss
+            # (quantized kernels are CPU-only, so this is skipped on GPU)
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        _eager_model = model
+        if config.SENTIMENT_COMPILE:
+            model = _compile_model(model, tokenizer)
+        _tokenizer = tokenizer
+        _model = model
+        logger.info("FinBERT model loaded on %s", _DEVICE)
+
+
+def _to_device(inputs) -> dict:
+    """Move tokenized inputs to the model's device.
+
+    On GPU the tensors are pinned first so the host-to-device copies can run
+    asynchronously.
+    """
+    if _DEVICE == "cpu":
+        return dict(inputs)
+    return {k: v.pin_memory().to(_DEVICE, non_blocking=True) for k, v in inputs.items()}
+
+
+def _autocast():
+    """Mixed-precision context for inference: bf16/fp16 on GPU, a no-op on CPU."""
+    if _DEVICE == "cpu":
+        return torch.autocast(device_type="cpu", enabled=False)
+    dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    return torch.autocast(device_type=_DEVICE, dtype=dtype)
+
+
+def _compile_model(model, tokenizer):
+    """Compile the model with torch.compile, keeping the eager model if that fails.
+
+    Compilation happens on the first forward pass, so a warm-up batch shaped
+    like a real one (BATCH_SIZE texts, PAD_MULTIPLE tokens) is run here to
+    surface errors at load time rather than mid-analysis.
+    """
+    if not hasattr(torch, "compile"):
+        return model
+    try:
+        compiled = torch.compile(model, dynamic=True)
+        inputs = tokenizer(["warm-up"] * BATCH_SIZE, padding="max_length", max_length=PAD_MULTIPLE,
+                           return_tensors="pt")
+        with torch.inference_mode(), _autocast():
+            compiled(**_to_device(inputs))
+        return compiled
+    except Exception:
+        logger.warning("torch.compile failed, running FinBERT eagerly", exc_info=True)
+        return model
+
 
+def _predict(inputs):
+    """Run FinBERT on a tokenized batch and return its logits.
 
-def analyze_sentiment(articles: list[dict], batch_size: int = 16) -> list[dict]:
+    If the compiled model fails (e.g. recompiling for a new batch shape), the
+    eager model takes over for this and every later batch.
+    """
+    global _model
+    model = _model
+    try:
+        with torch.inference_mode(), _autocast():
+            return model(**_to_device(inputs)).logits
+    except Exception:
+        if model is _eager_model:
+            raise
+        logger.warning("Compiled FinBERT failed, switching to the eager model", exc_info=True)
+        _model = _eager_model
+        with torch.inference_mode(), _autocast():
+            return _eager_model(**_to_device(inputs)).logits
+
+
+def _read_cache(keys) -> dict[str, tuple[str, float]]:
+    """Look up cached (sentiment, confidence) results for the given keys."""
+    try:
+        with _cache_lock, shelve.open(config.SENTIMENT_CACHE_PATH) as cache:
+            return {key: cache[key] for key in keys if key in cache}
+    except Exception:
+        logger.warning("Sentiment cache unavailable, scoring without it", exc_info=True)
+        return {}
+
+
+def _write_cache(results: dict[str, tuple[str, float]]):
+    """Store new (sentiment, confidence) results in the cache."""
+    try:
+        with _cache_lock, shelve.open(config.SENTIMENT_CACHE_PATH) as cache:
+            cache.update(results)
+    except Exception:
+        logger.warning("Could not update the sentiment cache", exc_info=True)
+
+
+def _cache_tag() -> str:
+    """Identify the model setup, so its predictions aren't reused by another one.
+
+    Mirrors _load_model: int8-quantized on CPU, mixed precision on GPU.
+    """
+    precision = "cuda-autocast" if torch.cuda.is_available() else "cpu-int8"
+    return f"{MODEL_NAME}|{precision}|{MAX_LENGTH}"
+
+
+def _cache_key(art: dict, tag: str) -> str:
+    """Hash the model tag and an article's title and summary into a sentiment cache key."""
+    text = tag + "\n" + art["title"] + "\n" + (art.get("summary") or "")
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def analyze_sentiment(articles: list[dict], batch_size: int = BATCH_SIZE) -> list[dict]:
     """Run FinBERT sentiment analysis on a list of articles.
 
     Adds 'sentiment' (positive/negative/neutral) and 'confidence' (0-1) to each article dict.
@@ -30,45 +172,73 @@ def analyze_sentiment(articles: list[dict], batch_size: int = 16) -> list[dict]:
     if not articles:
         return articles
 
-    _load_model()
+    # Reuse cached results and only run FinBERT once per unseen article text;
+    # the same headline filed under several tickers shares one prediction
+    tag = _cache_tag()
+    keys = [_cache_key(art, tag) for art in articles]
+    cached = _read_cache(set(keys))
+    pending: dict[str, list[dict]] = {}
+    hits = 0
+    for key, art in zip(keys, articles):
+        if key in cached:
+            art["sentiment"], art["confidence"] = cached[key]
+            hits += 1
+        else:
+            pending.setdefault(key, []).append(art)
+    logger.info("Sentiment cache: %d hits, %d unique texts to score", hits, len(pending))
+
+    if pending:
+        _load_model()
 
     label_map = {0: "positive", 1: "negative", 2: "neutral"}
+    groups = list(pending.items())
 
-    for i in range(0, len(articles), batch_size):
-        batch = articles[i : i + batch_size]
-        texts = []
-        for art in batch:
-            text = art["title"]
-            if art.get("summary"):
-                text += ". " + art["summary"]
-            # Truncate to avoid token limit issues
-            texts.append(text[:512])
+    texts = []
+    for _, arts in groups:
+        art = arts[0]
+        text = art["title"]
+        if art.get("summary"):
+            text += ". " + art["summary"]
+        # Truncate to avoid token limit issues
+        texts.append(text[:512])
+
+    # Batch texts of similar length together so each batch pads to roughly
+    # its own length rather than to the longest text in a random batch
+    order = sorted(range(len(texts)), key=lambda k: len(texts[k]))
+
+    results = {}
+    for i in range(0, len(order), batch_size):
+        batch = order[i : i + batch_size]
 
         try:
             inputs = _tokenizer(
-                texts,
-                padding=True,
+                [texts[k] for k in batch],
+                padding="longest",
+                pad_to_multiple_of=PAD_MULTIPLE,
                 truncation=True,
-                max_length=512,
+                max_length=MAX_LENGTH,
                 return_tensors="pt",
             )
-            with torch.no_grad():
-                outputs = _model(**inputs)
-            probs = torch.nn.functional.softmax(outputs.logits, dim=-1)
+            probs = torch.nn.functional.softmax(_predict(inputs).float(), dim=-1)
             predictions = torch.argmax(probs, dim=-1)
 
-            for j, art in enumerate(batch):
+            for j, k in enumerate(batch):
+                key, arts = groups[k]
                 pred_idx = predictions[j].item()
-                art["sentiment"] = label_map[pred_idx]
-                art["confidence"] = probs[j][pred_idx].item()
+                results[key] = (label_map[pred_idx], probs[j][pred_idx].item())
+                for art in arts:
+                    art["sentiment"], art["confidence"] = results[key]
         except Exception:
             logger.exception("Error in sentiment analysis batch %d", i)
-            for art in batch:
-                art["sentiment"] = "neutral"
-                art["confidence"] = 0.0
-
-    pos = sum(1 for a in articles if a["sentiment"] == "positive")
-    neg = sum(1 for a in articles if a["sentiment"] == "negative")
-    neu = sum(1 for a in articles if a["sentiment"] == "neutral")
-    logger.info("Sentiment results: %d positive, %d negative, %d neutral", pos, neg, neu)
+            for k in batch:
+                for art in groups[k][1]:
+                    art["sentiment"] = "neutral"
+                    art["confidence"] = 0.0
+
+    if results:
+        _write_cache(results)
+
+    counts = Counter(a["sentiment"] for a in articles)
+    logger.info("Sentiment results: %d positive, %d negative, %d neutral",
+                counts["positive"], counts["negative"], counts["neutral"])
     return articles
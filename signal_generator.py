@@ -1,5 +1,6 @@
 import logging
-from collections import defaultdict
+
+import numpy as np
 
 import config
 
@@ -7,6 +8,9 @@ logger = logging.getLogger(__name__)
 
 SENTIMENT_SCORES = {"positive": 1.0, "negative": -1.0, "neutral": 0.0}
 
+# Per-article columns pulled out of the article dicts by generate_signals
+_COLUMNS_DTYPE = np.dtype([("ticker", np.int64), ("score", np.float64), ("confidence", np.float64)])
+
 
 def generate_signals(articles: list[dict]) -> dict[str, dict]:
     """Aggregate article sentiments into BUY/SELL/HOLD signals per asset.
@@ -23,63 +27,72 @@ def generate_signals(articles: list[dict]) -> dict[str, dict]:
         }
     }
     """
-    # Group articles by ticker
-    by_ticker: dict[str, list[dict]] = defaultdict(list)
-    for art in articles:
-        by_ticker[art["ticker"]].append(art)
+    # Unpack the watched articles into columns in a single pass (one structured
+    # array record per article); per-ticker sums are then bincount reductions
+    ticker_index = {ticker: i for i, ticker in enumerate(config.ALL_TICKERS)}
+    watched = [art for art in articles if art["ticker"] in ticker_index]
+    n_tickers = len(config.ALL_TICKERS)
+
+    columns = np.fromiter(
+        ((ticker_index[art["ticker"]],
+          SENTIMENT_SCORES.get(art.get("sentiment", "neutral"), 0.0),
+          art.get("confidence", 0.5)) for art in watched),
+        dtype=_COLUMNS_DTYPE, count=len(watched),
+    )
+    idx, scores, confs = columns["ticker"], columns["score"], columns["confidence"]
+
+    # Skip low-confidence neutral articles to prevent signal dilution
+    kept = ~((scores == 0.0) & (confs < 0.7))
+
+    # Weighted average: sentiment_score * confidence
+    counts = np.bincount(idx, minlength=n_tickers)
+    weighted_sum = np.bincount(idx, weights=np.where(kept, scores * confs, 0.0), minlength=n_tickers)
+    weight_total = np.bincount(idx, weights=np.where(kept, confs, 0.0), minlength=n_tickers)
+    avg_score = np.divide(weighted_sum, weight_total,
+                          out=np.zeros(n_tickers), where=weight_total > 0)
+    avg_confidence = np.divide(weight_total, counts,
+                               out=np.zeros(n_tickers), where=counts > 0)
+
+    # Determine signal
+    enough = counts >= config.MIN_ARTICLES
+    signal_labels = np.select(
+        [(avg_score > config.BUY_THRESHOLD) & enough, (avg_score < config.SELL_THRESHOLD) & enough],
+        ["BUY", "SELL"],
+        default="HOLD",
+    )
+
+    # Highest-confidence kept article per ticker (first one on ties): sort the
+    # candidates by ticker, then confidence descending, and take each group's head
+    best_article = np.full(n_tickers, -1)
+    candidates = np.flatnonzero(kept & (confs > 0))
+    if candidates.size:
+        candidates = candidates[np.lexsort((-confs[candidates], idx[candidates]))]
+        group_idx = idx[candidates]
+        head = np.r_[True, group_idx[1:] != group_idx[:-1]]
+        best_article[group_idx[head]] = candidates[head]
 
     signals = {}
-    for ticker in config.ALL_TICKERS:
-        ticker_articles = by_ticker.get(ticker, [])
-        count = len(ticker_articles)
+    for t, ticker in enumerate(config.ALL_TICKERS):
+        count = int(counts[t])
 
         if count == 0:
             signals[ticker] = _empty_signal(ticker)
             continue
 
-        # Weighted average: sentiment_score * confidence
-        weighted_sum = 0.0
-        weight_total = 0.0
-        best_article = None
-        best_confidence = 0.0
-
-        for art in ticker_articles:
-            score = SENTIMENT_SCORES.get(art.get("sentiment", "neutral"), 0.0)
-            conf = art.get("confidence", 0.5)
-            # Skip low-confidence neutral articles to prevent signal dilution
-            if score == 0.0 and conf < 0.7:
-                continue
-            weighted_sum += score * conf
-            weight_total += conf
-
-            if conf > best_confidence:
-                best_confidence = conf
-                best_article = art
-
-        avg_score = weighted_sum / weight_total if weight_total > 0 else 0.0
-        avg_confidence = weight_total / count if count > 0 else 0.0
-
-        # Determine signal
-        if avg_score > config.BUY_THRESHOLD and count >= config.MIN_ARTICLES:
-            signal = "BUY"
-        elif avg_score < config.SELL_THRESHOLD and count >= config.MIN_ARTICLES:
-            signal = "SELL"
-        else:
-            signal = "HOLD"
-
+        signal = str(signal_labels[t])
         signals[ticker] = {
             "signal": signal,
-            "score": round(avg_score, 3),
-            "confidence": round(avg_confidence * 100, 1),
+            "score": round(float(avg_score[t]), 3),
+            "confidence": round(float(avg_confidence[t]) * 100, 1),
             "article_count": count,
-            "top_headline": best_article["title"] if best_article else "",
+            "top_headline": watched[best_article[t]]["title"] if best_article[t] >= 0 else "",
             "display_name": config.ASSET_DISPLAY_NAMES.get(ticker, ticker),
         }
 
         logger.info(
             "%s (%s): %s (score=%.3f, articles=%d, confidence=%.1f%%)",
             ticker, signals[ticker]["display_name"], signal,
-            avg_score, count, signals[ticker]["confidence"],
+            avg_score[t], count, signals[ticker]["confidence"],
         )
 
     return signals